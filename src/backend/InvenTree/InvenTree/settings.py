@@ -185,6 +185,11 @@ MEDIA_ROOT = config.get_media_dir()
 # Needed for the parts importer, directly impacts the maximum parts that can be uploaded
 DATA_UPLOAD_MAX_NUMBER_FIELDS = 10000
 
+# Number of rows fetched from the database per round-trip when exporting data
+EXPORT_CHUNK_SIZE = get_setting(
+    'INVENTREE_EXPORT_CHUNK_SIZE', 'export_chunk_size', 2000, typecast=int
+)
+
 # Web URL endpoint for served static files
 STATIC_URL = '/static/'
 
@@ -1,6 +1,7 @@
 """Mixin classes for the exporter app."""
 
 from collections import OrderedDict
+from collections.abc import Iterator
 from typing import Any
 
 from django.core.exceptions import ValidationError
@@ -198,14 +199,27 @@ class DataExportSerializerMixin:
         Returns:
             File object containing the exported data
         """
-        field_names = list(headers.keys())
+        # Freeze the header mapping once, rather than consulting it for each row
+        field_names = tuple(headers.keys())
         field_headers = list(headers.values())
 
+        # Flat keys are read directly from each row,
+        # nested keys (dot notation) are resolved via get_nested_value
+        nested_override = (
+            type(self).get_nested_value
+            is not DataExportSerializerMixin.get_nested_value
+        )
+
+        lookups = tuple((name, nested_override or '.' in name) for name in field_names)
+
         # Create a new dataset with the provided header labels
         dataset = tablib.Dataset(headers=field_headers)
 
         for row in data:
-            dataset.append([self.get_nested_value(row, f) for f in field_names])
+            dataset.append([
+                self.get_nested_value(row, name) if nested or not row else row.get(name)
+                for name, nested in lookups
+            ])
 
         return dataset.export(file_format)
 
@@ -362,7 +376,7 @@ class DataExportViewMixin:
             raise ValidationError(export_error)
 
         # The provided plugin is responsible for exporting the data
-        # The returned data *must* be a list of dict objects
+        # The returned data *must* be a list (or generator) of dict objects
         try:
             data = export_plugin.export_data(
                 queryset, serializer_class, headers, export_context, output
@@ -376,11 +390,33 @@ class DataExportViewMixin:
 
             raise ValidationError(export_error)
 
-        if not isinstance(data, list):
+        if not isinstance(data, (list, Iterator)):
             raise ValidationError(
                 _('Data export plugin returned incorrect data format')
             )
 
+        # Set if an error occurs while consuming streamed rows
+        stream_failed = False
+
+        def stream_rows(rows):
+            """Consume rows from a streamed export, attributing any errors to the plugin.
+
+            Yields:
+                Each row (a dict object) returned by the plugin
+            """
+            nonlocal stream_failed
+
+            try:
+                yield from rows
+            except Exception as e:
+                stream_failed = True
+                InvenTree.exceptions.log_error('export_data', plugin=export_plugin.slug)
+                output.mark_failure(error=str(e))
+                raise ValidationError(export_error)
+
+        if isinstance(data, Iterator):
+            data = stream_rows(data)
+
         # Augment / update the headers (if required)
         if hasattr(export_plugin, 'update_headers'):
             try:
@@ -398,6 +434,10 @@ class DataExportViewMixin:
         try:
             datafile = serializer.export_to_file(data, headers, export_format)
         except Exception as e:
+            if stream_failed:
+                # Error already logged while consuming streamed rows
+                raise
+
             InvenTree.exceptions.log_error('export_to_file', plugin=export_plugin.slug)
             output.mark_failure(error=str(e))
             raise ValidationError(_('Error occurred during data export'))
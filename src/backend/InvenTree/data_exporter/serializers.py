@@ -49,23 +49,56 @@ class DataExportOptionsSerializer(serializers.Serializer):
         plugin_options = []
 
         for plugin in registry.with_mixin(PluginMixinEnum.EXPORTER):
-            try:
-                supports_export = plugin.supports_export(
+            if self.plugin_supports_export(
+                plugin, model_class, request, serializer_class, view_class
+            ):
+                plugin_options.append((plugin.slug, plugin.name))
+
+        self.fields['export_plugin'].choices = plugin_options
+
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def plugin_supports_export(
+        plugin, model_class, request, serializer_class, view_class
+    ) -> bool:
+        """Determine if the provided plugin supports exporting the given model.
+
+        The result is cached against the request, as the export options serializer
+        may be constructed multiple times while handling a single request.
+        Plugins can opt out of this cache by setting CACHEABLE_EXPORT_SUPPORT = False.
+        """
+        cache = None
+
+        if request is not None and getattr(plugin, 'CACHEABLE_EXPORT_SUPPORT', True):
+            cache = getattr(request, '_export_support_cache', None)
+
+            if cache is None:
+                cache = {}
+                request._export_support_cache = cache
+
+        key = (plugin.slug, model_class, serializer_class, view_class)
+
+        if cache is not None and key in cache:
+            return cache[key]
+
+        try:
+            supports_export = bool(
+                plugin.supports_export(
                     model_class,
                     user=request.user if request else None,
                     serializer_class=serializer_class,
                     view_class=view_class,
                 )
-            except Exception:
-                InvenTree.exceptions.log_error('supports_export', plugin=plugin.slug)
-                supports_export = False
+            )
+        except Exception:
+            InvenTree.exceptions.log_error('supports_export', plugin=plugin.slug)
+            supports_export = False
 
-            if supports_export:
-                plugin_options.append((plugin.slug, plugin.name))
-
-        self.fields['export_plugin'].choices = plugin_options
+        if cache is not None:
+            cache[key] = supports_export
 
-        super().__init__(*args, **kwargs)
+        return supports_export
 
     export_format = serializers.ChoiceField(
         choices=InvenTree.helpers.GetExportOptions(),
@@ -3012,6 +3012,82 @@ class BomItemTest(InvenTreeAPITestCase):
                 self.assertEqual(str(row['Assembly']), '100')
                 self.assertEqual(str(row['BOM Level']), '1')
 
+    def test_bom_export_multi_level(self):
+        """Test multi-level BOM export, where a sub-assembly is used in multiple places."""
+        parts = {}
+
+        for name in ['Top', 'Sub A', 'Sub B', 'Shared', 'Leaf']:
+            parts[name] = Part.objects.create(
+                name=name,
+                description='Multi-level BOM test part',
+                assembly=name != 'Leaf',
+                component=name != 'Top',
+            )
+
+        # Rebuild the part trees, so that each new part has a unique tree_id
+        # (parts within the same tree cannot be added to each other's BOM)
+        Part.objects.rebuild()
+
+        for part in parts.values():
+            part.refresh_from_db()
+
+        self.assertEqual(len({part.tree_id for part in parts.values()}), len(parts))
+
+        # The 'Shared' sub-assembly appears beneath both 'Sub A' and 'Sub B'
+        for assembly, component, quantity in [
+            ('Top', 'Sub A', 2),
+            ('Top', 'Sub B', 3),
+            ('Sub A', 'Shared', 4),
+            ('Sub B', 'Shared', 5),
+            ('Shared', 'Leaf', 6),
+        ]:
+            BomItem.objects.create(
+                part=parts[assembly], sub_part=parts[component], quantity=quantity
+            )
+
+        url = reverse('api-bom-list')
+
+        # Export all levels of the BOM
+        with self.export_data(
+            url,
+            {'part': parts['Top'].pk, 'ordering': 'sub_part'},
+            export_plugin='bom-exporter',
+            export_levels=0,
+        ) as data_file:
+            data = self.process_csv(
+                data_file,
+                required_cols=['Component.Name', 'BOM Level', 'Total Quantity'],
+                required_rows=6,
+            )
+
+        expected = [
+            ('Sub A', 1, 2),
+            ('Shared', 2, 8),
+            ('Leaf', 3, 48),
+            ('Sub B', 1, 3),
+            ('Shared', 2, 15),
+            ('Leaf', 3, 90),
+        ]
+
+        for row, (name, level, total) in zip(data, expected, strict=True):
+            self.assertEqual(row['Component.Name'], name)
+            self.assertEqual(int(row['BOM Level']), level)
+            self.assertEqual(Decimal(row['Total Quantity']), Decimal(total))
+
+        # Limit the export to two levels
+        with self.export_data(
+            url,
+            {'part': parts['Top'].pk, 'ordering': 'sub_part'},
+            export_plugin='bom-exporter',
+            export_levels=2,
+        ) as data_file:
+            data = self.process_csv(data_file, required_rows=4)
+
+        self.assertEqual(
+            [(row['Component.Name'], int(row['BOM Level'])) for row in data],
+            [('Sub A', 1), ('Shared', 2), ('Sub B', 1), ('Shared', 2)],
+        )
+
     def test_can_build(self):
         """Test that the 'can_build' annotation works as expected."""
         # Create an assembly part
@@ -1,18 +1,59 @@
 """Plugin class for custom data exporting."""
 
 from collections import OrderedDict
+from collections.abc import Iterator
+from functools import lru_cache, partial
+from operator import attrgetter
 from typing import Optional, Union
 
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import QuerySet
+from django.db.models.query_utils import DeferredAttribute
 
 from rest_framework import serializers, views
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 
 from common.models import DataOutput
 from InvenTree.helpers import current_date
 from plugin import PluginMixinEnum
 
 
+@lru_cache(maxsize=256)
+def get_model_columns(model_class: type) -> frozenset:
+    """Return the names of the plain database columns of a model class.
+
+    Only concrete, non-relational fields which are accessed via a plain
+    DeferredAttribute are included - i.e. fields for which the model attribute
+    is the same as the value read directly from the database. Fields with a
+    custom descriptor (e.g. files, or money fields) are excluded.
+
+    The model metadata does not change at runtime, so the result is cached.
+    """
+    columns = set()
+
+    for field in model_class._meta.concrete_fields:
+        if field.is_relation:
+            continue
+
+        descriptor = None
+
+        for cls in model_class.__mro__:
+            if field.attname in cls.__dict__:
+                descriptor = cls.__dict__[field.attname]
+                break
+
+        if type(descriptor) is DeferredAttribute:
+            columns.add(field.attname)
+
+    if model_class._meta.pk.attname in columns:
+        columns.add('pk')
+
+    return frozenset(columns)
+
+
 class DataExportMixin:
     """Mixin which provides ability to customize data exports.
 
@@ -22,6 +63,12 @@ class DataExportMixin:
 
     ExportOptionsSerializer = None
 
+    # Serialize simple model columns directly, bypassing DRF attribute lookup
+    USE_FAST_SERIALIZER = True
+
+    # The result of supports_export may be cached for the duration of a request
+    CACHEABLE_EXPORT_SUPPORT = True
+
     class MixinMeta:
         """Meta options for this mixin."""
 
@@ -51,6 +98,9 @@ class DataExportMixin:
 
         Returns:
             True if the plugin supports exporting data for the given model
+
+        Note: The result is cached for the duration of the request. If the result
+        may change within a single request, set CACHEABLE_EXPORT_SUPPORT = False.
         """
         # By default, plugins support all models
         return True
@@ -83,6 +133,253 @@ class DataExportMixin:
         # The default implementation returns the queryset unchanged
         return queryset
 
+    def optimize_queryset(
+        self, queryset: QuerySet, serializer: serializers.Serializer
+    ) -> QuerySet:
+        """Optimize the queryset before serializing the exported data.
+
+        Inspects the fields of the provided serializer, to reduce the number
+        of database queries performed while serializing each row:
+
+        - Single-valued relations (ForeignKey or OneToOne) which are traversed by a field are fetched via select_related
+        - Many-to-many and reverse relations which are serialized are fetched via prefetch_related
+
+        Lookups which are already prefetched or selected by the queryset (e.g. by the
+        annotate_queryset method of the serializer) are left untouched, as these may
+        provide a custom (annotated) queryset for the related model.
+
+        Arguments:
+            queryset: The queryset to optimize
+            serializer: The serializer instance used to export the data
+
+        Returns: The optimized queryset
+        """
+        select, prefetch = self.get_related_lookups(queryset.model, serializer.fields)
+
+        existing = [
+            getattr(lookup, 'prefetch_to', lookup)
+            for lookup in queryset._prefetch_related_lookups
+        ]
+
+        def is_prefetched(lookup: str) -> bool:
+            """Return True if the lookup overlaps an existing prefetch lookup."""
+            return any(
+                lookup == other
+                or lookup.startswith(f'{other}__')
+                or other.startswith(f'{lookup}__')
+                for other in existing
+            )
+
+        select = {lookup for lookup in select if not is_prefetched(lookup)}
+        prefetch = {lookup for lookup in prefetch if not is_prefetched(lookup)}
+
+        selected = queryset.query.select_related
+
+        # select_related cannot traverse fields which have been deferred
+        deferred_fields, _defer = queryset.query.deferred_loading
+
+        if selected is True or deferred_fields:
+            select = set()
+        elif selected:
+            select -= self.get_selected_lookups(selected)
+
+        if select:
+            queryset = queryset.select_related(*sorted(select))
+
+        if prefetch:
+            queryset = queryset.prefetch_related(*sorted(prefetch))
+
+        return queryset
+
+    def get_selected_lookups(self, selected: dict, prefix: str = '') -> set:
+        """Return the lookups (and all of their prefixes) selected by a queryset.
+
+        Arguments:
+            selected: The (nested dict) select_related structure of the query
+            prefix: Lookup prefix (used for nested relations)
+        """
+        lookups = set()
+
+        for name, children in selected.items():
+            lookup = f'{prefix}{name}'
+            lookups.add(lookup)
+            lookups.update(self.get_selected_lookups(children, prefix=f'{lookup}__'))
+
+        return lookups
+
+    def get_related_lookups(self, model, fields: dict, prefix: str = '') -> tuple:
+        """Determine the related lookups required to serialize the provided fields.
+
+        Each field source (e.g. 'part.category.name') is followed through the model
+        relations, for as long as the relations are single-valued.
+
+        Arguments:
+            model: The model class which the fields are serialized from
+            fields: A dict of serializer fields
+            prefix: Lookup prefix (used for nested serializers)
+
+        Returns: A tuple of (select_related, prefetch_related) sets of lookups
+        """
+        select = set()
+        prefetch = set()
+
+        for field in fields.values():
+            source_attrs = getattr(field, 'source_attrs', None)
+
+            # Skip fields which do not map directly to a model attribute
+            if not source_attrs or getattr(field, 'write_only', False):
+                continue
+
+            # A pk-only related field reads the key from the parent instance
+            if (
+                isinstance(field, serializers.RelatedField)
+                and field.use_pk_only_optimization()
+            ):
+                source_attrs = source_attrs[:-1]
+
+            path = []
+            many = False
+            related_model = model
+
+            for attr in source_attrs:
+                try:
+                    model_field = related_model._meta.get_field(attr)
+                except FieldDoesNotExist:
+                    break
+
+                if not model_field.is_relation:
+                    break
+
+                if model_field.many_to_many or model_field.one_to_many:
+                    many = True
+                    path.append(attr)
+                    break
+
+                if not (model_field.one_to_one or model_field.concrete):
+                    # e.g. GenericForeignKey, which cannot be used with select_related
+                    break
+
+                path.append(attr)
+                related_model = model_field.related_model
+
+            complete = len(path) == len(field.source_attrs)
+
+            if many:
+                if complete and isinstance(
+                    field, (serializers.ListSerializer, serializers.ManyRelatedField)
+                ):
+                    prefetch.add(prefix + '__'.join(path))
+
+                # Select the single-valued relations leading up to the many relation
+                path = path[:-1]
+
+            if not path:
+                continue
+
+            lookup = prefix + '__'.join(path)
+            select.add(lookup)
+
+            if complete and not many and isinstance(field, serializers.Serializer):
+                # Recurse into the nested serializer
+                sub_select, sub_prefetch = self.get_related_lookups(
+                    related_model, field.fields, prefix=f'{lookup}__'
+                )
+
+                select.update(sub_select)
+                prefetch.update(sub_prefetch)
+
+        return select, prefetch
+
+    def get_export_fields(self, serializer: serializers.Serializer) -> tuple:
+        """Return the readable fields of the provided serializer, prepared for export.
+
+        Fields which map directly onto a (non-relational) model column are read
+        from the model instance via an attrgetter, rather than via DRF.
+
+        This is evaluated once per export, and the result reused for every row.
+        Note that it cannot be cached against the serializer class, as the available
+        fields depend on the serializer context.
+
+        Arguments:
+            serializer: The serializer instance used to export the data
+
+        Returns: A tuple of (field_name, field, getter, to_representation) tuples,
+        where getter is None if the value must be resolved by the serializer field
+        """
+        columns = frozenset()
+
+        if model := getattr(getattr(serializer, 'Meta', None), 'model', None):
+            columns = get_model_columns(model)
+
+        export_fields = []
+
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+
+            getter = None
+            source_attrs = field.source_attrs
+
+            if (
+                len(source_attrs) == 1
+                and source_attrs[0] in columns
+                and type(field).get_attribute is serializers.Field.get_attribute
+            ):
+                getter = attrgetter(source_attrs[0])
+
+            export_fields.append((
+                field.field_name,
+                field,
+                getter,
+                field.to_representation,
+            ))
+
+        return tuple(export_fields)
+
+    def fast_export_representation(self, instance, fields: tuple) -> dict:
+        """Serialize a single model instance for data export.
+
+        Produces the same output as serializer.to_representation(instance),
+        but simple model columns are read directly from the instance.
+
+        Arguments:
+            instance: The model instance to serialize
+            fields: The list of export fields, as returned by get_export_fields()
+
+        Returns: The serialized row (a dict object)
+        """
+        row = {}
+
+        for name, field, getter, to_representation in fields:
+            if getter:
+                value = getter(instance)
+                row[name] = None if value is None else to_representation(value)
+                continue
+
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+
+            if isinstance(attribute, PKOnlyObject):
+                check_for_none = attribute.pk
+            else:
+                check_for_none = attribute
+
+            if check_for_none is None:
+                row[name] = None
+            else:
+                row[name] = to_representation(attribute)
+
+        return row
+
+    def get_export_chunk_size(self) -> int:
+        """Return the number of rows to fetch from the database at a time.
+
+        Configured via the INVENTREE_EXPORT_CHUNK_SIZE setting.
+        """
+        return max(1, int(getattr(settings, 'EXPORT_CHUNK_SIZE', 2000)))
+
     def export_data(
         self,
         queryset: QuerySet,
@@ -107,7 +404,66 @@ class DataExportMixin:
         Returns: The exported data (a list of dict objects)
         """
         # The default implementation simply serializes the queryset
-        return serializer_class(queryset, many=True, exporting=True).data
+        return list(
+            self.stream_export_data(
+                queryset, serializer_class, headers, context, output, **kwargs
+            )
+        )
+
+    def stream_export_data(
+        self,
+        queryset: QuerySet,
+        serializer_class: serializers.Serializer,
+        headers: OrderedDict,
+        context: dict,
+        output: DataOutput,
+        **kwargs,
+    ) -> Iterator[dict]:
+        """Export data from the queryset, one row at a time.
+
+        This is a generator, which serializes each row as it is consumed,
+        rather than building the entire dataset in memory.
+
+        A plugin can opt in to streamed exports by returning the result of this
+        method from export_data. Note that in this case:
+
+        - The rows can only be iterated *once*. Do not modify the rows in a loop and
+          then return the (already consumed) generator - yield the modified rows instead.
+        - The update_headers method is called *before* the rows are consumed, so
+          the headers cannot depend on the exported data.
+
+        The queryset is read via QuerySet.iterator() (in chunks of EXPORT_CHUNK_SIZE rows),
+        which uses a server-side cursor where supported.
+
+        Arguments:
+            queryset: The queryset to export
+            serializer_class: The serializer class to use for exporting the data
+            headers: The headers for the export
+            context: Any custom context for the export (provided by the plugin serializer)
+            output: The DataOutput object for the export
+
+        Yields:
+            Each serialized row (a dict object)
+        """
+        serializer = serializer_class(exporting=True)
+
+        queryset = self.optimize_queryset(queryset, serializer)
+
+        # The fast path cannot be used if the serializer customizes the representation
+        fast = (
+            self.USE_FAST_SERIALIZER
+            and type(serializer).to_representation
+            is serializers.Serializer.to_representation
+        )
+
+        if fast:
+            fields = self.get_export_fields(serializer)
+            represent = partial(self.fast_export_representation, fields=fields)
+        else:
+            represent = serializer.to_representation
+
+        for instance in queryset.iterator(chunk_size=self.get_export_chunk_size()):
+            yield represent(instance)
 
     def get_export_options_serializer(
         self, **kwargs
@@ -146,7 +146,7 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
         queryset = queryset.prefetch_related('sub_part')
 
         if self.export_substitute_data:
-            queryset = queryset.prefetch_related('substitutes')
+            queryset = queryset.prefetch_related('substitutes', 'substitutes__part')
 
         if self.export_supplier_data:
             queryset = queryset.prefetch_related('sub_part__supplier_parts')
@@ -177,6 +177,9 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
         # A dict of "Parameter ID" -> "Parameter Name"
         self.parameters = {}
 
+        # A dict of "Part ID" -> [BomItem] for sub-assemblies already fetched
+        self.sub_items = {}
+
         # Extract the export options from the context (and cache for later)
         self.export_levels = context.get('export_levels', 1)
         self.export_stock_data = context.get('export_stock_data', True)
@@ -192,9 +195,16 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
 
         self.bom_data = []
 
-        # Run through each item in the queryset
-        for bom_item in queryset:
-            self.process_bom_row(bom_item, 1, **kwargs)
+        # Walk the BOM depth-first, using an explicit stack rather than recursion
+        # Each entry is a tuple of (bom_item, level, multiplier)
+        stack = [(bom_item, 1, None) for bom_item in reversed(list(queryset))]
+
+        while stack:
+            bom_item, level, multiplier = stack.pop()
+            sub_rows = self.process_bom_row(bom_item, level, multiplier, **kwargs)
+
+            # Reverse the sub-rows, so that they are processed in order
+            stack.extend(reversed(sub_rows))
 
         return self.bom_data
 
@@ -206,7 +216,11 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
         Arguments:
             bom_item: The BomItem object to process
             level: The current level of export
-            multiplier: The multiplier for the quantity (used for recursive calls)
+            multiplier: The multiplier for the quantity (used for sub-assembly rows)
+
+        Returns:
+            A list of (bom_item, level, multiplier) tuples for any sub-assembly rows
+            which should be exported beneath this row
         """
         # Add this row to the output dataset
         row = self.serializer_class(bom_item, exporting=True).data
@@ -240,16 +254,26 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
         if bom_item.sub_part.assembly and (
             self.export_levels <= 0 or level < self.export_levels
         ):
-            sub_items = bom_item.sub_part.get_bom_items()
-            sub_items = self.prefetch_queryset(sub_items)
-
-            for item in sub_items.all():
-                self.process_bom_row(
-                    item,
-                    level=level + 1,
-                    multiplier=multiplier * bom_item.quantity,
-                    **kwargs,
-                )
+            sub_multiplier = multiplier * bom_item.quantity
+
+            return [
+                (item, level + 1, sub_multiplier)
+                for item in self.get_sub_items(bom_item.sub_part)
+            ]
+
+        return []
+
+    def get_sub_items(self, part) -> list:
+        """Return the BOM items for a sub-assembly part.
+
+        The same sub-assembly can appear multiple times within a multi-level BOM,
+        so the (prefetched) BOM items are cached against the part ID.
+        """
+        if part.pk not in self.sub_items:
+            sub_items = self.prefetch_queryset(part.get_bom_items())
+            self.sub_items[part.pk] = list(sub_items)
+
+        return self.sub_items[part.pk]
 
     def get_substitute_data(self, bom_item: BomItem) -> dict:
         """Return substitute part data for a BomItem."""
@@ -19,3 +19,11 @@ class InvenTreeExporter(DataExportMixin, InvenTreePlugin):
     def supports_export(self, model_class: type, user, *args, **kwargs) -> bool:
         """This exporter supports all model classes."""
         return True
+
+    def export_data(
+        self, queryset, serializer_class, headers, context, output, **kwargs
+    ):
+        """Stream the exported rows, rather than building the dataset in memory."""
+        return self.stream_export_data(
+            queryset, serializer_class, headers, context, output, **kwargs
+        )
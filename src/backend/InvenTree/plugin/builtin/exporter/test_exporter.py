@@ -1,9 +1,31 @@
 """Unit test for the exporter plugins."""
 
+from collections import OrderedDict
+from collections.abc import Iterator
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from InvenTree.unit_test import InvenTreeAPITestCase
+from error_report.models import Error
+
+from common.models import DataOutput
+from company.api import ContactList
+from company.models import Company, Contact
+from company.serializers import ContactSerializer
+from data_exporter.mixins import DataExportSerializerMixin
+from data_exporter.serializers import DataExportOptionsSerializer
+from InvenTree.unit_test import InvenTreeAPITestCase, InvenTreeTestCase
+from part.api import PartList
+from part.models import BomItem, Part
+from part.serializers import BomItemSerializer, PartSerializer
+from plugin.builtin.exporter.inventree_exporter import InvenTreeExporter
 from plugin.registry import registry
+from stock.models import StockItem
+from stock.serializers import StockItemSerializer
 
 
 class StocktakeExporterTest(InvenTreeAPITestCase):
@@ -81,3 +103,307 @@ class StocktakeExporterTest(InvenTreeAPITestCase):
 
         # Reset plugin state
         registry.set_plugin_state(slug, False)
+
+
+class DataExportMixinTest(InvenTreeTestCase):
+    """Test the default functionality of the DataExportMixin class."""
+
+    fixtures = ['category', 'part', 'location', 'stock', 'bom', 'company', 'contact']
+
+    def export(self, plugin, queryset, serializer_class) -> list:
+        """Export the queryset using the provided plugin."""
+        return list(
+            plugin.export_data(queryset, serializer_class, OrderedDict(), {}, None)
+        )
+
+    def test_optimize_queryset(self):
+        """Test that queryset optimization does not alter the exported data."""
+        plugin = InvenTreeExporter()
+
+        # Construct the queryset in the same way as the API view
+        queryset = StockItemSerializer.annotate_queryset(
+            StockItem.objects.all()
+        ).order_by('pk')
+
+        serializer = StockItemSerializer(exporting=True)
+        optimized = plugin.optimize_queryset(queryset, serializer)
+
+        # Existing (annotated) prefetch lookups must not be overridden
+        self.assertNotIn('part', optimized.query.select_related or {})
+        self.assertNotIn('location', optimized.query.select_related or {})
+
+        with CaptureQueriesContext(connection) as expected_queries:
+            expected = StockItemSerializer(queryset, many=True, exporting=True).data
+
+        with CaptureQueriesContext(connection) as export_queries:
+            rows = self.export(plugin, queryset, StockItemSerializer)
+
+        self.assertGreater(len(rows), 0)
+        self.assertEqual(rows, expected)
+        self.assertLessEqual(len(export_queries), len(expected_queries))
+
+    def test_optimize_queryset_queries(self):
+        """Test that queryset optimization reduces the number of database queries."""
+        plugin = InvenTreeExporter()
+
+        for idx, company in enumerate(Company.objects.all()[:3]):
+            Contact.objects.create(company=company, name=f'Contact {idx}')
+
+        n = Contact.objects.count()
+        self.assertGreater(n, 1)
+
+        # Construct the queryset in the same way as the API view
+        queryset = ContactList.queryset.all().order_by('name')
+
+        # Each row requires an additional query, to fetch the company name
+        with self.assertNumQueries(n + 1):
+            expected = ContactSerializer(queryset, many=True, exporting=True).data
+
+        with self.assertNumQueries(1):
+            rows = self.export(plugin, queryset, ContactSerializer)
+
+        self.assertEqual(rows, expected)
+        self.assertIsNotNone(rows[0]['company_name'])
+
+    def check_export_data(self, queryset, serializer_class) -> list:
+        """Check that the exported data matches the output of the serializer."""
+        plugin = InvenTreeExporter()
+
+        expected = serializer_class(queryset, many=True, exporting=True).data
+
+        rows = self.export(plugin, queryset, serializer_class)
+
+        self.assertEqual(len(rows), queryset.count())
+        self.assertEqual(rows, expected)
+
+        # The streamed rows must also match
+        streamed = plugin.stream_export_data(
+            queryset, serializer_class, OrderedDict(), {}, None
+        )
+
+        self.assertEqual(list(streamed), expected)
+
+        return rows
+
+    def test_export_part_data(self):
+        """Test that the exported Part data matches the PartSerializer output."""
+        queryset = PartSerializer.annotate_queryset(Part.objects.all())
+        queryset = queryset.prefetch_related('salepricebreaks').order_by('pk')
+
+        rows = self.check_export_data(queryset, PartSerializer)
+
+        for part, row in zip(queryset, rows, strict=True):
+            self.assertEqual(row['pk'], part.pk)
+            # Related field which is serialized from a PKOnlyObject
+            self.assertEqual(row['category'], part.category_id)
+
+        # Part with a null category
+        row = next(row for row in rows if row['pk'] == 50)
+        self.assertIsNone(row['category'])
+
+    def test_export_bom_data(self):
+        """Test that the exported BomItem data matches the BomItemSerializer output."""
+        BomItem.objects.filter(pk=1).update(rounding_multiple=None)
+
+        queryset = BomItemSerializer.annotate_queryset(BomItem.objects.all()).order_by(
+            'pk'
+        )
+
+        rows = self.check_export_data(queryset, BomItemSerializer)
+
+        for item, row in zip(queryset, rows, strict=True):
+            self.assertEqual(row['pk'], item.pk)
+            # Related fields which are serialized from a PKOnlyObject
+            self.assertEqual(row['part'], item.part_id)
+            self.assertEqual(row['sub_part'], item.sub_part_id)
+
+        row = next(row for row in rows if row['pk'] == 1)
+        self.assertIsNone(row['rounding_multiple'])
+
+    def test_export_fields(self):
+        """Test the export field plan generated for a serializer."""
+        plugin = InvenTreeExporter()
+
+        serializer = BomItemSerializer(exporting=True)
+        fields = {
+            name: getter
+            for name, _f, getter, _r in plugin.get_export_fields(serializer)
+        }
+
+        self.assertEqual(list(fields.keys()), list(serializer.fields.keys()))
+
+        # Plain model columns are read directly from the instance
+        for name in ['pk', 'reference', 'quantity', 'rounding_multiple']:
+            self.assertIsNotNone(fields[name])
+
+        # Related and annotated fields are resolved by the serializer
+        for name in ['part', 'sub_part', 'sub_part_detail', 'pricing_min', 'can_build']:
+            self.assertIsNone(fields[name])
+
+        # The result of the fast path matches the exported data
+        queryset = BomItemSerializer.annotate_queryset(BomItem.objects.all()).order_by(
+            'pk'
+        )
+
+        rows = self.check_export_data(queryset, BomItemSerializer)
+        self.assertEqual(list(rows[0].keys()), list(fields.keys()))
+
+
+class ExportOptionsSerializerTest(InvenTreeTestCase):
+    """Test the DataExportOptionsSerializer class."""
+
+    def setUp(self):
+        """Ensure that the plugin registry is loaded."""
+        super().setUp()
+
+        registry.reload_plugins(full_reload=True, force_reload=True, collect=True)
+
+        # Note: The plugin modules may be re-imported when the registry is reloaded,
+        # so the live plugin instance must be patched (not the imported class)
+        self.plugin = registry.get_plugin('inventree-exporter')
+        self.assertIsNotNone(self.plugin)
+
+    def construct_serializer(self, request):
+        """Construct an export options serializer for the Part model."""
+        serializer = DataExportOptionsSerializer(
+            request=request,
+            model_class=Part,
+            serializer_class=PartSerializer,
+            view_class=PartList,
+        )
+
+        self.assertIn('inventree-exporter', serializer.fields['export_plugin'].choices)
+
+    def test_supports_export_cache(self):
+        """Test that supports_export is only evaluated once per request."""
+        request = RequestFactory().get('/')
+        request.user = self.user
+
+        with mock.patch.object(
+            self.plugin, 'supports_export', return_value=True
+        ) as supports_export:
+            self.construct_serializer(request)
+            self.assertEqual(supports_export.call_count, 1)
+
+            # A second construction within the same request uses the cached result
+            self.construct_serializer(request)
+            self.assertEqual(supports_export.call_count, 1)
+
+            # A new request is evaluated again
+            request = RequestFactory().get('/')
+            request.user = self.user
+
+            self.construct_serializer(request)
+            self.assertEqual(supports_export.call_count, 2)
+
+    def test_supports_export_no_cache(self):
+        """Test that the cache is bypassed if CACHEABLE_EXPORT_SUPPORT is False."""
+        request = RequestFactory().get('/')
+        request.user = self.user
+
+        with (
+            mock.patch.object(self.plugin, 'CACHEABLE_EXPORT_SUPPORT', False),
+            mock.patch.object(
+                self.plugin, 'supports_export', return_value=True
+            ) as supports_export,
+        ):
+            self.construct_serializer(request)
+            self.construct_serializer(request)
+
+            self.assertEqual(supports_export.call_count, 2)
+
+
+class DataExportViewTest(InvenTreeAPITestCase):
+    """Test the handling of plugin export data by the DataExportViewMixin class."""
+
+    fixtures = ['category', 'part', 'location']
+    roles = ['part.view']
+
+    def setUp(self):
+        """Ensure that the plugin registry is loaded."""
+        super().setUp()
+
+        registry.reload_plugins(full_reload=True, force_reload=True, collect=True)
+
+        self.plugin = registry.get_plugin('inventree-exporter')
+        self.assertIsNotNone(self.plugin)
+
+    def export(self, expected_code=200) -> DataOutput:
+        """Export the part list, and return the generated DataOutput object."""
+        self.get(
+            reverse('api-part-list'),
+            {
+                'export': True,
+                'export_format': 'csv',
+                'export_plugin': 'inventree-exporter',
+            },
+            expected_code=expected_code,
+        )
+
+        return DataOutput.objects.order_by('pk').last()
+
+    def errors(self, name: str):
+        """Return the errors logged against the exporter plugin."""
+        return Error.objects.filter(path=f'plugin.inventree-exporter.{name}')
+
+    def test_streamed_export(self):
+        """Test that a generator returned by the plugin is exported."""
+        rows = self.plugin.export_data(
+            Part.objects.all(), PartSerializer, OrderedDict(), {}, None
+        )
+
+        self.assertIsInstance(rows, Iterator)
+
+        output = self.export()
+
+        self.assertTrue(output.complete)
+        self.assertIsNone(output.errors)
+
+        with self.download_file(output.output.url) as data_file:
+            self.process_csv(data_file, required_rows=Part.objects.count())
+
+    def test_streamed_export_empty(self):
+        """Test that a generator which yields no rows produces an empty export."""
+        with mock.patch.object(self.plugin, 'export_data', return_value=iter([])):
+            output = self.export()
+
+        self.assertTrue(output.complete)
+        self.assertIsNone(output.errors)
+
+        with self.download_file(output.output.url) as data_file:
+            self.process_csv(data_file, required_rows=0)
+
+    def test_streamed_export_error(self):
+        """Test that an error raised while consuming streamed rows fails the export."""
+
+        def rows(*args, **kwargs):
+            yield {'pk': 1, 'name': 'Part'}
+            raise ValueError('Streaming failed')
+
+        with mock.patch.object(self.plugin, 'export_data', side_effect=rows):
+            output = self.export(expected_code=400)
+
+        self.assertFalse(output.complete)
+        self.assertEqual(output.errors, {'error': 'Streaming failed'})
+
+        # The error is attributed to the plugin export_data method
+        self.assertEqual(self.errors('export_data').count(), 1)
+        self.assertEqual(self.errors('export_to_file').count(), 0)
+
+    def test_export_to_file_error(self):
+        """Test that a ValidationError raised while writing a list export fails the export."""
+        with (
+            mock.patch.object(self.plugin, 'export_data', return_value=[{'pk': 1}]),
+            mock.patch.object(
+                DataExportSerializerMixin,
+                'export_to_file',
+                side_effect=ValidationError('Invalid data'),
+            ),
+        ):
+            output = self.export(expected_code=400)
+
+        self.assertFalse(output.complete)
+        self.assertIsNotNone(output.errors)
+
+        self.assertEqual(self.errors('export_to_file').count(), 1)
+        self.assertEqual(self.errors('export_data').count(), 0)